@@ -1,52 +1,329 @@
 #!/usr/bin/env python3
 """Linear MCP Server - Simple Linear issue management via GraphQL API."""
 
+import asyncio
+import hashlib
+import itertools
 import os
-import json
-from typing import Optional
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Optional
 
 import httpx
+import orjson
 from fastmcp import FastMCP
 
 LINEAR_API_URL = "https://api.linear.app/graphql"
+# Parsed once so requests don't re-parse the URL string
+_API_URL = httpx.URL(LINEAR_API_URL)
 
-mcp = FastMCP("linear-mcp")
+# Maximum number of aliased root fields sent in a single batched request
+BATCH_SIZE = 25
+
+# Response bodies are read in chunks of this many bytes
+_STREAM_CHUNK_SIZE = 65536
+
+# How long cached team workflow states and team listings stay fresh, in seconds
+_TTL = 600.0
+
+# How long a fetched issue is served from the response cache, in seconds
+_ISSUE_TTL = 30.0
 
+# Most entries kept in the response and user caches; the oldest are evicted first
+_RESP_CACHE_SIZE = 256
+_USER_CACHE_SIZE = 1024
 
-def get_api_key() -> str:
-    """Get Linear API key from environment."""
-    key = os.environ.get("LINEAR_API_KEY")
-    if not key:
+mcp = FastMCP("linear-mcp")
+
+# Shared client so every call after the first reuses the pooled HTTP/2
+# connection (and its TLS session) instead of doing a fresh handshake. Its
+# connections are bound to the server's event loop and are released when the
+# process exits.
+_ACLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=20,
+        keepalive_expiry=300.0,
+    ),
+)
+
+# Team key -> (fetched at, workflow states). Keyed by team key since it is the
+# prefix of every issue identifier, so a hit is known before any lookup.
+_STATES_CACHE: dict[str, tuple[float, list]] = {}
+# User email -> (fetched at, user ID), oldest first
+_USER_CACHE: OrderedDict[str, tuple[float, str]] = OrderedDict()
+# Hash of query and variables -> (fetched at, response data), oldest first
+_RESP_CACHE: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+# Hash of query and variables -> request currently being sent for it
+_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
+def _cache_get(cache: dict[str, tuple[float, Any]], key: str, ttl: float = _TTL) -> Any:
+    """Return a cached value if it is younger than the TTL, else drop it and return None."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    del cache[key]
+    return None
+
+
+def _cache_put(cache: dict[str, tuple[float, Any]], key: str, value: Any, max_size: Optional[int] = None) -> None:
+    """Store a value in a TTL cache, evicting the oldest entries of an OrderedDict past max_size."""
+    cache[key] = (time.monotonic(), value)
+    if max_size is not None:
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+# Read once at startup. A missing key only raises once a tool makes a
+# request, so the module can still be imported without one.
+_API_KEY = os.environ.get("LINEAR_API_KEY")
+_AUTH_HEADERS = httpx.Headers({
+    "Authorization": _API_KEY,
+    "Content-Type": "application/json",
+}) if _API_KEY else None
+
+
+def get_request_headers() -> httpx.Headers:
+    """Get the headers sent with every request."""
+    if _AUTH_HEADERS is None:
         raise ValueError("LINEAR_API_KEY environment variable not set")
-    return key
+    return _AUTH_HEADERS
 
 
-def graphql_request(query: str, variables: Optional[dict] = None) -> dict:
-    """Execute a GraphQL request against Linear API."""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": api_key,
-        "Content-Type": "application/json",
-    }
+def _build_payload(query: str, variables: Optional[dict]) -> bytes:
+    """Build the JSON body of a GraphQL request."""
     payload = {"query": query}
     if variables:
         payload["variables"] = variables
+    return orjson.dumps(payload)
+
 
-    response = httpx.post(LINEAR_API_URL, headers=headers, json=payload, timeout=30.0)
+class GraphQLError(Exception):
+    """GraphQL errors returned by Linear, along with any partial data."""
+
+    def __init__(self, errors: list[dict], data: Optional[dict]):
+        dumped = orjson.dumps(errors, option=orjson.OPT_INDENT_2).decode()
+        super().__init__(f"GraphQL errors: {dumped}")
+        self.errors = errors
+        self.data = data or {}
+
+
+def _parse_response(response: httpx.Response, body: bytearray) -> dict:
+    """Check a GraphQL response and return its data."""
     response.raise_for_status()
-    result = response.json()
+    result = orjson.loads(body)
 
     if "errors" in result:
-        raise Exception(f"GraphQL errors: {json.dumps(result['errors'], indent=2)}")
+        raise GraphQLError(result["errors"], result.get("data"))
 
     return result.get("data", {})
 
 
-def _get_issue_internal(identifier: str) -> dict:
-    """Internal helper to get issue - can be called by other functions."""
-    query = """
-    query GetIssue($term: String!) {
-      searchIssues(term: $term, first: 1) {
+def _response_cache_key(query: str, variables: Optional[dict]) -> str:
+    """Hash a query and its variables into a response cache key."""
+    return hashlib.blake2b(query.encode() + orjson.dumps(variables or {})).hexdigest()
+
+
+def _is_mutation(query: str) -> bool:
+    """Check whether a GraphQL document is a mutation."""
+    return query.lstrip().startswith("mutation")
+
+
+async def _send_request(query: str, variables: Optional[dict]) -> dict:
+    """Send one GraphQL request and return its data."""
+    request = _ACLIENT.build_request(
+        "POST", _API_URL, headers=get_request_headers(), content=_build_payload(query, variables)
+    )
+    # Stream the body into one buffer rather than joining a copy of every chunk
+    response = await _ACLIENT.send(request, stream=True)
+    try:
+        body = bytearray()
+        async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+            body.extend(chunk)
+    finally:
+        await response.aclose()
+    return _parse_response(response, body)
+
+
+async def _send_shared(query: str, variables: Optional[dict], key: str, cache: bool) -> dict:
+    """Send a query on behalf of every caller waiting on it, caching the result if asked."""
+    try:
+        data = await _send_request(query, variables)
+        # A mutation that landed meanwhile replaces this task, so don't cache stale data
+        if cache and _INFLIGHT.get(key) is asyncio.current_task():
+            _cache_put(_RESP_CACHE, key, data, _RESP_CACHE_SIZE)
+        return data
+    finally:
+        if _INFLIGHT.get(key) is asyncio.current_task():
+            del _INFLIGHT[key]
+
+
+async def graphql_request_async(
+    query: str, variables: Optional[dict] = None, _cache_ttl: Optional[float] = None
+) -> dict:
+    """
+    Execute a GraphQL request against Linear API.
+
+    Pass _cache_ttl for idempotent queries to serve repeats from memory for that
+    many seconds. Concurrent identical queries share one request, and any
+    mutation empties the cache.
+    """
+    if _is_mutation(query):
+        try:
+            return await _send_request(query, variables)
+        finally:
+            # Even a failed mutation may have partly applied, so drop cached data either way.
+            # Queries already in flight may predate it too; later callers send their own.
+            _RESP_CACHE.clear()
+            _INFLIGHT.clear()
+
+    key = _response_cache_key(query, variables)
+    if _cache_ttl is not None:
+        cached = _cache_get(_RESP_CACHE, key, _cache_ttl)
+        if cached is not None:
+            return cached
+
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_send_shared(query, variables, key, _cache_ttl is not None))
+        _INFLIGHT[key] = task
+    # Shielded so one caller being cancelled doesn't cancel the request for the others
+    return await asyncio.shield(task)
+
+
+async def graphql_batch(operation: str, fields: list[tuple[str, dict[str, tuple[str, Any]]]]) -> list[dict]:
+    """
+    Execute several root fields as one aliased GraphQL document in a single request.
+
+    Args:
+        operation: Either 'query' or 'mutation'
+        fields: (field, variables) pairs, where field is a root field selection
+            referencing its own variables (e.g. '$email') and variables maps each
+            variable name to its (GraphQL type, value)
+
+    Returns:
+        The data for each field, in the same order as given. A field that failed
+        while others succeeded is returned as {"error": ...} instead.
+    """
+    if not fields:
+        return []
+
+    var_decls = []
+    selections = []
+    variables = {}
+    for i, (field, field_vars) in enumerate(fields):
+        # Suffix every variable with the field's index so fields can't collide
+        selections.append(f"f{i}: " + re.sub(r"\$(\w+)", lambda m: f"${m.group(1)}_{i}", field.strip()))
+        for name, (gql_type, value) in field_vars.items():
+            var_decls.append(f"${name}_{i}: {gql_type}")
+            variables[f"{name}_{i}"] = value
+
+    decls = f"({', '.join(var_decls)})" if var_decls else ""
+    document = f"{operation} Batch{decls} {{\n" + "\n".join(selections) + "\n}"
+    try:
+        data = await graphql_request_async(document, variables)
+    except GraphQLError as exc:
+        # Errors scoped to an alias only fail that field; anything else fails the batch
+        field_errors: dict[str, list[str]] = {}
+        for error in exc.errors:
+            path = error.get("path") or []
+            if not path or not re.fullmatch(r"f\d+", str(path[0])):
+                raise
+            field_errors.setdefault(path[0], []).append(error.get("message", "Unknown error"))
+        results = []
+        for i in range(len(fields)):
+            if f"f{i}" in field_errors:
+                results.append({"error": "; ".join(field_errors[f"f{i}"])})
+            else:
+                results.append(exc.data.get(f"f{i}") or {})
+        return results
+    return [data.get(f"f{i}") or {} for i in range(len(fields))]
+
+
+# Root field selections shared by single and batched lookups. Issues are
+# looked up by team key and number, an exact match on indexed fields, rather
+# than through full-text search.
+_ISSUE_LIGHT_FIELD = """
+    issues(filter: { team: { key: { eq: $teamKey } }, number: { eq: $number } }, first: 1) {
+      nodes {
+        id
+        identifier
+        title
+        state {
+          id
+          name
+          type
+        }
+        team {
+          id
+        }
+      }
+    }
+"""
+
+_ISSUE_STATES_FIELD = """
+    issues(filter: { team: { key: { eq: $teamKey } }, number: { eq: $number } }, first: 1) {
+      nodes {
+        id
+        identifier
+        title
+        state {
+          id
+          name
+          type
+        }
+        team {
+          id
+          key
+          states {
+            nodes {
+              id
+              name
+              type
+            }
+          }
+        }
+      }
+    }
+"""
+
+_USER_BY_EMAIL_FIELD = """
+    users(filter: { email: { eq: $email } }) {
+      nodes {
+        id
+        name
+        email
+      }
+    }
+"""
+
+_UPDATE_STATUS_FIELD = """
+    issueUpdate(id: $issueId, input: { stateId: $stateId }) {
+      success
+      issue {
+        id
+        identifier
+        title
+        state {
+          name
+          type
+        }
+      }
+    }
+"""
+
+
+# Full queries and mutations, built once at import
+_GET_ISSUE_QUERY = """
+    query GetIssue($teamKey: String!, $number: Float!) {
+      issues(filter: { team: { key: { eq: $teamKey } }, number: { eq: $number } }, first: 1) {
         nodes {
           id
           identifier
@@ -96,25 +373,211 @@ def _get_issue_internal(identifier: str) -> dict:
         }
       }
     }
+"""
+
+_GET_ISSUE_LIGHT_QUERY = f"query GetIssueLight($teamKey: String!, $number: Float!) {{ {_ISSUE_LIGHT_FIELD} }}"
+
+_RESOLVE_ISSUE_STATES_QUERY = f"query ResolveIssueStates($teamKey: String!, $number: Float!) {{ {_ISSUE_STATES_FIELD} }}"
+
+_ISSUE_SUMMARY_NODES = """
+    nodes {
+      id
+      identifier
+      title
+      priority
+      priorityLabel
+      url
+      state {
+        name
+        type
+      }
+      assignee {
+        name
+      }
+      team {
+        key
+        name
+      }
+    }
+"""
+
+# Full-text search when $search is set, otherwise a plain filtered listing.
+# Filter values are passed as variables, never interpolated into the query.
+_SEARCH_ISSUES_QUERY = f"""
+query SearchIssues($search: Boolean!, $term: String!, $filter: IssueFilter, $limit: Int!) {{
+  searchIssues(term: $term, filter: $filter, first: $limit) @include(if: $search) {{ {_ISSUE_SUMMARY_NODES} }}
+  issues(filter: $filter, first: $limit) @skip(if: $search) {{ {_ISSUE_SUMMARY_NODES} }}
+}}
+"""
+
+_LIST_TEAMS_QUERY = """
+    query ListTeams {
+      teams {
+        nodes {
+          id
+          name
+          key
+          states {
+            nodes {
+              id
+              name
+              type
+              position
+            }
+          }
+        }
+      }
+    }
+"""
+
+_UPDATE_STATUS_MUTATION = f"mutation UpdateIssue($issueId: String!, $stateId: String!) {{ {_UPDATE_STATUS_FIELD} }}"
+
+_CREATE_COMMENT_MUTATION = """
+    mutation CreateComment($issueId: String!, $body: String!) {
+      commentCreate(input: { issueId: $issueId, body: $body }) {
+        success
+        comment {
+          id
+          body
+          createdAt
+          user {
+            name
+          }
+        }
+      }
+    }
+"""
+
+# Fields update_issue can set, with their GraphQL variable types
+_UPDATE_ISSUE_FIELDS = {
+    "title": "String!",
+    "description": "String!",
+    "priority": "Int!",
+    "assigneeId": "String",
+}
+
+
+def _build_update_issue_mutation(fields: tuple[str, ...]) -> str:
+    """Build the issueUpdate mutation for one combination of fields."""
+    var_decls = ["$issueId: String!"] + [f"${field}: {_UPDATE_ISSUE_FIELDS[field]}" for field in fields]
+    input_fields = [f"{field}: ${field}" for field in fields]
+    return f"""
+    mutation UpdateIssue({", ".join(var_decls)}) {{
+      issueUpdate(id: $issueId, input: {{ {", ".join(input_fields)} }}) {{
+        success
+        issue {{
+          id
+          identifier
+          title
+          description
+          priority
+          priorityLabel
+          state {{
+            name
+          }}
+          assignee {{
+            name
+            email
+          }}
+        }}
+      }}
+    }}
     """
-    variables = {"term": identifier}
-    data = graphql_request(query, variables)
 
-    issues = data.get("searchIssues", {}).get("nodes", [])
+
+# Set of provided fields -> mutation, for every non-empty combination
+_UPDATE_ISSUE_MUTATIONS = {
+    frozenset(fields): _build_update_issue_mutation(fields)
+    for count in range(1, len(_UPDATE_ISSUE_FIELDS) + 1)
+    for fields in itertools.combinations(_UPDATE_ISSUE_FIELDS, count)
+}
+
+
+_IDENTIFIER_RE = re.compile(r"([A-Za-z0-9]+)-(\d+)")
+
+# GraphQL types of the variables returned by _identifier_vars
+_IDENTIFIER_VAR_TYPES = {"teamKey": "String!", "number": "Float!"}
+
+
+def _identifier_vars(identifier: str) -> Optional[dict]:
+    """Split an issue identifier into lookup variables (e.g. 'SRE-152' -> team key 'SRE', number 152)."""
+    match = _IDENTIFIER_RE.fullmatch(identifier.strip())
+    if not match:
+        return None
+    return {"teamKey": match.group(1).upper(), "number": int(match.group(2))}
+
+
+def _identifier_field(field: str, variables: dict) -> tuple[str, dict[str, tuple[str, Any]]]:
+    """Pair an issue lookup field with its typed identifier variables, for graphql_batch."""
+    return field, {name: (_IDENTIFIER_VAR_TYPES[name], value) for name, value in variables.items()}
+
+
+def _invalid_identifier(identifier: str) -> dict:
+    """Error returned for identifiers that aren't of the form 'SRE-152'."""
+    return {"error": f"Invalid issue identifier '{identifier}', expected a team key and number like 'SRE-152'"}
+
+
+def _first_issue(result: dict, identifier: str) -> dict:
+    """Return the first issue node of a search result, or a not-found error."""
+    issues = result.get("nodes", [])
     if not issues:
         return {"error": f"Issue {identifier} not found"}
+    return issues[0]
 
-    # Verify we got the exact identifier (search might return similar results)
-    for issue in issues:
-        if issue.get("identifier") == identifier:
-            return issue
 
-    # Return first result if no exact match
-    return issues[0]
+def _match_state(states: list[dict], state_name: str) -> dict:
+    """Find a workflow state by name (case-insensitive), or return a not-found error."""
+    for state in states:
+        if state["name"].lower() == state_name.lower():
+            return state
+    available = [s["name"] for s in states]
+    return {"error": f"State '{state_name}' not found. Available states: {available}"}
+
+
+def _unchanged_status(issue: dict) -> dict:
+    """Result returned when an issue is already in the requested state, so no update is sent."""
+    return {
+        "success": True,
+        "unchanged": True,
+        # Same keys as the issueUpdate result in _UPDATE_STATUS_FIELD
+        "issue": {
+            "id": issue["id"],
+            "identifier": issue["identifier"],
+            "title": issue["title"],
+            "state": {"name": issue["state"]["name"], "type": issue["state"]["type"]},
+        },
+    }
+
+
+async def _get_issue_internal(identifier: str) -> dict:
+    """Internal helper to get issue - can be called by other functions."""
+    variables = _identifier_vars(identifier)
+    if variables is None:
+        return _invalid_identifier(identifier)
+    data = await graphql_request_async(_GET_ISSUE_QUERY, variables, _cache_ttl=_ISSUE_TTL)
+    return _first_issue(data.get("issues", {}), identifier)
+
+
+async def _get_issue_light(identifier: str) -> dict:
+    """Internal helper to look up just an issue's ID and team, for mutations."""
+    variables = _identifier_vars(identifier)
+    if variables is None:
+        return _invalid_identifier(identifier)
+    data = await graphql_request_async(_GET_ISSUE_LIGHT_QUERY, variables)
+    return _first_issue(data.get("issues", {}), identifier)
+
+
+async def _resolve_issue_min(identifier: str) -> dict:
+    """Internal helper to look up an issue's ID with its team's workflow states in one request."""
+    variables = _identifier_vars(identifier)
+    if variables is None:
+        return _invalid_identifier(identifier)
+    data = await graphql_request_async(_RESOLVE_ISSUE_STATES_QUERY, variables)
+    return _first_issue(data.get("issues", {}), identifier)
 
 
 @mcp.tool()
-def get_issue(identifier: str) -> dict:
+async def get_issue(identifier: str) -> dict:
     """
     Get a Linear issue by its identifier (e.g., 'SRE-152').
 
@@ -124,11 +587,11 @@ def get_issue(identifier: str) -> dict:
     Returns:
         Issue details including title, description, status, assignee, labels, and comments
     """
-    return _get_issue_internal(identifier)
+    return await _get_issue_internal(identifier)
 
 
 @mcp.tool()
-def search_issues(
+async def search_issues(
     query: Optional[str] = None,
     team_key: Optional[str] = None,
     state_name: Optional[str] = None,
@@ -148,113 +611,55 @@ def search_issues(
     Returns:
         List of matching issues with basic details
     """
+    # Clamp to the supported range rather than letting the API reject it
+    limit = max(1, min(int(limit), 50))
+
     # Build filter
-    filters = []
+    issue_filter = {}
     if team_key:
-        filters.append(f'team: {{ key: {{ eq: "{team_key}" }} }}')
+        issue_filter["team"] = {"key": {"eq": team_key}}
     if state_name:
-        filters.append(f'state: {{ name: {{ eqIgnoreCase: "{state_name}" }} }}')
+        issue_filter["state"] = {"name": {"eqIgnoreCase": state_name}}
     if assignee_email:
-        filters.append(f'assignee: {{ email: {{ eq: "{assignee_email}" }} }}')
-
-    filter_str = ", ".join(filters)
-    filter_clause = f"filter: {{ {filter_str} }}" if filters else ""
+        issue_filter["assignee"] = {"email": {"eq": assignee_email}}
 
-    # Use search query if provided
-    if query:
-        gql_query = f"""
-        query SearchIssues($term: String!, $limit: Int!) {{
-          searchIssues(term: $term, first: $limit) {{
-            nodes {{
-              id
-              identifier
-              title
-              priority
-              priorityLabel
-              url
-              state {{
-                name
-                type
-              }}
-              assignee {{
-                name
-              }}
-              team {{
-                key
-                name
-              }}
-            }}
-          }}
-        }}
-        """
-        variables = {"term": query, "limit": min(limit, 50)}
-        data = graphql_request(gql_query, variables)
-        return {"issues": data.get("searchIssues", {}).get("nodes", [])}
-    else:
-        # No search query, just filter
-        gql_query = f"""
-        query ListIssues($limit: Int!) {{
-          issues(first: $limit, {filter_clause}) {{
-            nodes {{
-              id
-              identifier
-              title
-              priority
-              priorityLabel
-              url
-              state {{
-                name
-                type
-              }}
-              assignee {{
-                name
-              }}
-              team {{
-                key
-                name
-              }}
-            }}
-          }}
-        }}
-        """
-        variables = {"limit": min(limit, 50)}
-        data = graphql_request(gql_query, variables)
-        return {"issues": data.get("issues", {}).get("nodes", [])}
+    variables = {
+        "search": bool(query),
+        "term": query or "",
+        "filter": issue_filter or None,
+        "limit": limit,
+    }
+    data = await graphql_request_async(_SEARCH_ISSUES_QUERY, variables)
+    results = data.get("searchIssues") if query else data.get("issues")
+    return {"issues": (results or {}).get("nodes", [])}
 
 
 @mcp.tool()
-def list_teams() -> dict:
+async def list_teams() -> dict:
     """
     List all teams with their workflow states.
 
     Returns:
         List of teams with their IDs, keys, names, and available workflow states
     """
-    query = """
-    query ListTeams {
-      teams {
-        nodes {
-          id
-          name
-          key
-          states {
-            nodes {
-              id
-              name
-              type
-              position
-            }
-          }
-        }
-      }
-    }
-    """
-    data = graphql_request(query)
-    return {"teams": data.get("teams", {}).get("nodes", [])}
+    data = await graphql_request_async(_LIST_TEAMS_QUERY, _cache_ttl=_TTL)
+    teams = data.get("teams", {}).get("nodes", [])
+    for team in teams:
+        if _cache_get(_STATES_CACHE, team["key"]) is None:
+            _cache_put(_STATES_CACHE, team["key"], team["states"]["nodes"])
+    return {"teams": teams}
+
+
+async def _apply_status(issue: dict, target_state: dict) -> dict:
+    """Move an issue to a workflow state, skipping the mutation if it's already there."""
+    if issue["state"]["id"] == target_state["id"]:
+        return _unchanged_status(issue)
+    result = await graphql_request_async(_UPDATE_STATUS_MUTATION, {"issueId": issue["id"], "stateId": target_state["id"]})
+    return result.get("issueUpdate", {})
 
 
 @mcp.tool()
-def update_issue_status(identifier: str, state_name: str) -> dict:
+async def update_issue_status(identifier: str, state_name: str) -> dict:
     """
     Update an issue's workflow status.
 
@@ -263,67 +668,126 @@ def update_issue_status(identifier: str, state_name: str) -> dict:
         state_name: The target state name (e.g., 'In Progress', 'Done', 'Todo')
 
     Returns:
-        Updated issue details
+        Updated issue details, marked unchanged if it was already in that state
     """
-    # First, get the issue to find its ID and team
-    issue = _get_issue_internal(identifier)
+    lookup_vars = _identifier_vars(identifier)
+    if lookup_vars is None:
+        return _invalid_identifier(identifier)
+
+    # With cached states, check the name before spending a lookup on it
+    team_key = lookup_vars["teamKey"]
+    states = _cache_get(_STATES_CACHE, team_key)
+    if states is not None:
+        target_state = _match_state(states, state_name)
+        if "error" not in target_state:
+            issue = await _get_issue_light(identifier)
+            if "error" in issue:
+                return issue
+            try:
+                return await _apply_status(issue, target_state)
+            except Exception:
+                # The cached state may have been deleted; retry once with fresh states
+                pass
+        # A miss may just mean the cached states are stale
+        _STATES_CACHE.pop(team_key, None)
+
+    # Get the issue ID and its team's current workflow states in a single request
+    issue = await _resolve_issue_min(identifier)
     if "error" in issue:
         return issue
+    team_key = issue["team"]["key"]
+    states = issue["team"]["states"]["nodes"]
+    _cache_put(_STATES_CACHE, team_key, states)
+
+    target_state = _match_state(states, state_name)
+    if "error" in target_state:
+        return target_state
+
+    try:
+        return await _apply_status(issue, target_state)
+    except Exception:
+        _STATES_CACHE.pop(team_key, None)
+        raise
+
+
+async def _bulk_update_chunk(chunk: list[dict]) -> list[dict]:
+    """Look up and update one batch of bulk_update_status items, in two requests."""
+    # Check every item up front; each entry is lookup variables or an error
+    lookup_vars = []
+    for item in chunk:
+        if not isinstance(item, dict) or not isinstance(item.get("identifier"), str) \
+                or not isinstance(item.get("state_name"), str):
+            lookup_vars.append({"error": "Each item needs an 'identifier' and a 'state_name'"})
+            continue
+        variables = _identifier_vars(item["identifier"])
+        lookup_vars.append(variables if variables is not None else _invalid_identifier(item["identifier"]))
+
+    # Find every issue in the chunk, with its team's workflow states, in one request
+    lookups = iter(await graphql_batch("query", [
+        _identifier_field(_ISSUE_STATES_FIELD, variables)
+        for variables in lookup_vars
+        if "error" not in variables
+    ]))
+
+    results: list[dict] = []
+    updates = []
+    for item, variables in zip(chunk, lookup_vars):
+        if "error" in variables:
+            issue = variables
+        else:
+            lookup = next(lookups)
+            issue = lookup if "error" in lookup else _first_issue(lookup, item["identifier"])
+        if "error" in issue:
+            results.append(issue)
+            continue
+        _cache_put(_STATES_CACHE, issue["team"]["key"], issue["team"]["states"]["nodes"])
+        target_state = _match_state(issue["team"]["states"]["nodes"], item["state_name"])
+        if "error" in target_state:
+            results.append(target_state)
+            continue
+        if issue["state"]["id"] == target_state["id"]:
+            results.append(_unchanged_status(issue))
+            continue
+        # Placeholder, filled in once the batched update returns
+        results.append({})
+        updates.append((len(results) - 1, issue["id"], target_state["id"]))
+
+    # Apply all updates in the chunk in one request
+    if updates:
+        updated = await graphql_batch("mutation", [
+            (_UPDATE_STATUS_FIELD, {"issueId": ("String!", issue_id), "stateId": ("String!", state_id)})
+            for _, issue_id, state_id in updates
+        ])
+        for (index, _, _), result in zip(updates, updated):
+            results[index] = result
+
+    return results
 
-    issue_id = issue["id"]
-    team_id = issue["team"]["id"]
-
-    # Get the team's workflow states to find the target state ID
-    states_query = """
-    query GetTeamStates($teamId: String!) {
-      team(id: $teamId) {
-        states {
-          nodes {
-            id
-            name
-            type
-          }
-        }
-      }
-    }
+
+@mcp.tool()
+async def bulk_update_status(items: list[dict]) -> dict:
     """
-    states_data = graphql_request(states_query, {"teamId": team_id})
-    states = states_data.get("team", {}).get("states", {}).get("nodes", [])
+    Update the workflow status of several issues at once.
 
-    # Find matching state (case-insensitive)
-    target_state = None
-    for state in states:
-        if state["name"].lower() == state_name.lower():
-            target_state = state
-            break
+    Lookups and updates are batched, so each group of up to 25 issues costs
+    one request to find them and one request to update them. Groups are sent
+    concurrently, and issues already in their target state are skipped.
 
-    if not target_state:
-        available = [s["name"] for s in states]
-        return {"error": f"State '{state_name}' not found. Available states: {available}"}
+    Args:
+        items: List of {"identifier": ..., "state_name": ...} objects
+            (e.g., [{"identifier": "SRE-152", "state_name": "Done"}])
 
-    # Update the issue
-    mutation = """
-    mutation UpdateIssue($issueId: String!, $stateId: String!) {
-      issueUpdate(id: $issueId, input: { stateId: $stateId }) {
-        success
-        issue {
-          id
-          identifier
-          title
-          state {
-            name
-            type
-          }
-        }
-      }
-    }
+    Returns:
+        Per-item results in the same order as given, each either the updated
+        issue details or an error
     """
-    result = graphql_request(mutation, {"issueId": issue_id, "stateId": target_state["id"]})
-    return result.get("issueUpdate", {})
+    chunks = [items[start:start + BATCH_SIZE] for start in range(0, len(items), BATCH_SIZE)]
+    chunk_results = await asyncio.gather(*(_bulk_update_chunk(chunk) for chunk in chunks))
+    return {"results": [result for results in chunk_results for result in results]}
 
 
 @mcp.tool()
-def add_comment(identifier: str, body: str) -> dict:
+async def add_comment(identifier: str, body: str) -> dict:
     """
     Add a comment to an issue.
 
@@ -335,33 +799,18 @@ def add_comment(identifier: str, body: str) -> dict:
         Created comment details
     """
     # Get the issue ID
-    issue = _get_issue_internal(identifier)
+    issue = await _get_issue_light(identifier)
     if "error" in issue:
         return issue
 
     issue_id = issue["id"]
 
-    mutation = """
-    mutation CreateComment($issueId: String!, $body: String!) {
-      commentCreate(input: { issueId: $issueId, body: $body }) {
-        success
-        comment {
-          id
-          body
-          createdAt
-          user {
-            name
-          }
-        }
-      }
-    }
-    """
-    result = graphql_request(mutation, {"issueId": issue_id, "body": body})
+    result = await graphql_request_async(_CREATE_COMMENT_MUTATION, {"issueId": issue_id, "body": body})
     return result.get("commentCreate", {})
 
 
 @mcp.tool()
-def update_issue(
+async def update_issue(
     identifier: str,
     title: Optional[str] = None,
     description: Optional[str] = None,
@@ -381,90 +830,67 @@ def update_issue(
     Returns:
         Updated issue details
     """
-    # Get the issue ID
-    issue = _get_issue_internal(identifier)
+    # Reject invalid input before spending a request on it
+    if priority is not None and priority not in (0, 1, 2, 3, 4):
+        return {"error": f"Invalid priority {priority}. Priority must be 0-4 (0=none, 1=urgent, 2=high, 3=medium, 4=low)"}
+    if title is None and description is None and priority is None and assignee_email is None:
+        return {"error": "No fields to update. Provide at least one of: title, description, priority, assignee_email"}
+
+    # Get the issue ID, together with the assignee lookup when one is needed
+    lookup_vars = _identifier_vars(identifier)
+    if lookup_vars is None:
+        return _invalid_identifier(identifier)
+    lookups = [_identifier_field(_ISSUE_LIGHT_FIELD, lookup_vars)]
+    assignee_id = _cache_get(_USER_CACHE, assignee_email) if assignee_email is not None else None
+    if assignee_email is not None and assignee_id is None:
+        lookups.append((_USER_BY_EMAIL_FIELD, {"email": ("String!", assignee_email)}))
+    issue_result, *user_result = await graphql_batch("query", lookups)
+    if "error" in issue_result:
+        return issue_result
+    if user_result and "error" in user_result[0]:
+        return user_result[0]
+
+    issue = _first_issue(issue_result, identifier)
+    if user_result and user_result[0].get("nodes"):
+        assignee_id = user_result[0]["nodes"][0]["id"]
+        _cache_put(_USER_CACHE, assignee_email, assignee_id, _USER_CACHE_SIZE)
     if "error" in issue:
         return issue
+    if assignee_email is not None and assignee_id is None:
+        return {"error": f"User with email '{assignee_email}' not found"}
 
     issue_id = issue["id"]
 
-    # Build input object
-    input_fields = []
+    # Collect the fields to update
     variables = {"issueId": issue_id}
-
     if title is not None:
-        input_fields.append("title: $title")
         variables["title"] = title
     if description is not None:
-        input_fields.append("description: $description")
         variables["description"] = description
     if priority is not None:
-        input_fields.append("priority: $priority")
         variables["priority"] = priority
-
-    # Handle assignee lookup
-    if assignee_email is not None:
-        # Look up user by email
-        user_query = """
-        query FindUser($email: String!) {
-          users(filter: { email: { eq: $email } }) {
-            nodes {
-              id
-              name
-              email
-            }
-          }
-        }
-        """
-        user_data = graphql_request(user_query, {"email": assignee_email})
-        users = user_data.get("users", {}).get("nodes", [])
-        if not users:
-            return {"error": f"User with email '{assignee_email}' not found"}
-        input_fields.append("assigneeId: $assigneeId")
-        variables["assigneeId"] = users[0]["id"]
-
-    if not input_fields:
-        return {"error": "No fields to update. Provide at least one of: title, description, priority, assignee_email"}
-
-    # Build variable declarations
-    var_decls = ["$issueId: String!"]
-    if "title" in variables:
-        var_decls.append("$title: String!")
-    if "description" in variables:
-        var_decls.append("$description: String!")
-    if "priority" in variables:
-        var_decls.append("$priority: Int!")
-    if "assigneeId" in variables:
-        var_decls.append("$assigneeId: String")
-
-    mutation = f"""
-    mutation UpdateIssue({", ".join(var_decls)}) {{
-      issueUpdate(id: $issueId, input: {{ {", ".join(input_fields)} }}) {{
-        success
-        issue {{
-          id
-          identifier
-          title
-          description
-          priority
-          priorityLabel
-          state {{
-            name
-          }}
-          assignee {{
-            name
-            email
-          }}
-        }}
-      }}
-    }}
-    """
-    result = graphql_request(mutation, variables)
+    if assignee_id is not None:
+        variables["assigneeId"] = assignee_id
+
+    mutation = _UPDATE_ISSUE_MUTATIONS[frozenset(variables) - {"issueId"}]
+    try:
+        result = await graphql_request_async(mutation, variables)
+    except Exception:
+        # The cached user may have been deactivated; look them up again next time
+        if assignee_email is not None:
+            _USER_CACHE.pop(assignee_email, None)
+        raise
     return result.get("issueUpdate", {})
 
 
 def main():
     """Run the MCP server."""
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run()
 
 